@@ -1,77 +1,278 @@
 import streamlit as st
-import requests
-import time
+import httpx
+import orjson
 import os
+import atexit
+import asyncio
+import bisect
+import random
+import time
+import threading
+import streamlit.components.v1 as components
+from streamlit_autorefresh import st_autorefresh
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
-# 应用配置
-st.set_page_config(
-    page_title="比特币价格追踪器",
-    page_icon="₿",
-    layout="centered"
+# 环境配置只在导入时读取一次
+_API_URL = os.getenv('COINGECKO_API_URL',
+                     "https://api.coingecko.com/api/v3/simple/price")
+_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '10'))
+
+# 自定义CSS样式
+_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        color: #F7931A;
+        text-align: center;
+        margin-bottom: 1rem;
+        font-weight: bold;
+    }
+    .price-display {
+        font-size: 3.5rem;
+        font-weight: bold;
+        text-align: center;
+        color: #F7931A;
+        margin: 1rem 0;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
+    }
+    .metric-card {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 10px;
+        border-left: 4px solid #F7931A;
+        margin: 0.5rem 0;
+    }
+    .stButton button {
+        border-radius: 8px;
+        font-weight: bold;
+    }
+    .stAlert {
+        border-radius: 10px;
+    }
+</style>
+"""
+
+_HEADER_HTML = '<div class="main-header">₿ 比特币价格追踪器</div>'
+
+
+@st.cache_resource
+def _css_html() -> str:
+    """静态CSS字符串只构建一次，跨重跑与会话复用"""
+    return _CSS
+
+
+def _bootstrap():
+    """每次运行的初始化：页面配置、样式注入与 session state 准备"""
+    st.set_page_config(
+        page_title="比特币价格追踪器",
+        page_icon="₿",
+        layout="centered"
+    )
+    st.markdown(_css_html(), unsafe_allow_html=True)
+    if 'retry_mode' not in st.session_state:
+        st.session_state.retry_mode = False
+
+
+@dataclass
+class _Flight:
+    """一次在途请求：等待方从这里取结果，请求结束后随对象一起回收"""
+    event: threading.Event = field(default_factory=threading.Event)
+    result: Optional[Dict[str, Any]] = None
+
+
+# singleflight 状态（进程内跨会话共享）：同一参数的并发请求只放行一个上游调用
+_fetch_lock = threading.Lock()
+_inflight: Dict[str, _Flight] = {}
+
+# 趋势分析阈值表：按涨跌幅上界升序排列，渲染时二分定位对应档位
+_TREND = (
+    (-5, st.error, "📉 大幅下跌: 过去24小时大幅下跌 {v:.2f}%"),
+    (-2, st.error, "🔻 明显下跌: 过去24小时下跌 {v:.2f}%"),
+    (0, st.warning, "↘️ 小幅下跌: 过去24小时微跌 {v:.2f}%"),
+    (0.0001, st.info, "➡️ 价格平稳: 过去24小时价格基本持平"),
+    (2, st.info, "↗️ 小幅上涨: 过去24小时微涨 {v:.2f}%"),
+    (5, st.success, "📈 稳步上涨: 过去24小时上涨 {v:.2f}%"),
+    (float('inf'), st.success, "🚀 强势上涨: 过去24小时大幅上涨 {v:.2f}%"),
 )
+_TREND_THRESHOLDS = [threshold for threshold, _, _ in _TREND]
+
+
+@lru_cache(maxsize=32)
+def _fmt_ts(ts: int) -> str:
+    """格式化更新时间（strftime 结果按时间戳缓存，未变化时直接查表）"""
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+
+
+@dataclass(frozen=True, slots=True)
+class PriceView:
+    """单个币种渲染所需的预计算视图：算术与格式化只做一次"""
+    current: float
+    prev: float
+    change_pct: float
+    change_abs: float
+    volume: float
+    updated_at: Optional[int]
+    formatted_current: str
+    formatted_prev: str
+    formatted_change: str
+
+
+@st.cache_data(ttl=30)
+def render_html(view: PriceView) -> str:
+    """将主价格区与指标卡合成单个HTML片段，整块渲染只需一条消息"""
+    updated = f"🕒 {_fmt_ts(int(view.updated_at))}" if view.updated_at else ""
+    delta_color = "#09ab3b" if view.change_pct >= 0 else "#ff2b2b"
+    return f"""
+    <div class="price-display">{view.formatted_current}</div>
+    <div style="text-align:center;color:#808495;font-size:0.8rem;">{updated}</div>
+    <hr>
+    <div style="display:flex;gap:0.5rem;">
+        <div class="metric-card" style="flex:1;">
+            <div style="color:#808495;font-size:0.85rem;">当前价格</div>
+            <div style="font-size:1.4rem;font-weight:bold;">{view.formatted_current}</div>
+            <div style="color:{delta_color};font-size:0.9rem;">{view.change_pct:.2f}%</div>
+        </div>
+        <div class="metric-card" style="flex:1;">
+            <div style="color:#808495;font-size:0.85rem;">24小时前价格</div>
+            <div style="font-size:1.4rem;font-weight:bold;">{view.formatted_prev}</div>
+        </div>
+        <div class="metric-card" style="flex:1;">
+            <div style="color:#808495;font-size:0.85rem;">24小时交易量</div>
+            <div style="font-size:1.4rem;font-weight:bold;">${view.volume:,.0f}</div>
+        </div>
+    </div>
+    """
 
 
 class BitcoinPriceTracker:
-    def __init__(self):
-        self.api_url = os.getenv('COINGECKO_API_URL',
-                                 "https://api.coingecko.com/api/v3/simple/price")
-        self.timeout = int(os.getenv('REQUEST_TIMEOUT', '10'))
+    def __init__(self, coin_ids: Optional[list] = None, vs_currencies: Optional[list] = None):
+        self.api_url = _API_URL
+        self.timeout = _TIMEOUT
+        # CoinGecko 支持逗号分隔的批量查询：N 个币种/货币仍是一次请求
+        self.coin_ids = list(coin_ids) if coin_ids else ['bitcoin']
+        self.vs_currencies = list(vs_currencies) if vs_currencies else ['usd']
         self.params = {
-            'ids': 'bitcoin',
-            'vs_currencies': 'usd',
+            'ids': ','.join(self.coin_ids),
+            'vs_currencies': ','.join(self.vs_currencies),
             'include_24hr_change': 'true',
             'include_24hr_vol': 'true',
             'include_last_updated_at': 'true'
         }
+        # 常驻事件循环线程：所有异步请求都在同一个 loop 上执行，
+        # 连接池才能安全地跨 Streamlit 脚本线程（每次重跑一个新线程）复用
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever,
+                         name="btc-fetch-loop", daemon=True).start()
+        # 复用支持 HTTP/2 的异步长连接客户端，避免每次请求重新建立 TCP+TLS 连接
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={
+                # 声明 br/gzip 压缩与固定 UA：JSON 响应体积可缩小数倍
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, br',
+                'User-Agent': 'BitcoinPriceTracker/1.0'
+            }
+        )
+        atexit.register(self._close_client)
+        # 条件请求状态：按参数组合记录 ETag 与上次成功的响应数据
+        self._etags: Dict[str, str] = {}
+        self._last_bodies: Dict[str, Dict[str, Any]] = {}
+        # 最近一次价格格式化结果 (price, formatted)
+        self._last_fmt: Optional[tuple] = None
+
+    def _run_async(self, coro):
+        """把协程提交到常驻事件循环并同步等待结果"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _close_client(self):
+        """进程退出时在持有连接的事件循环上关闭客户端，再停掉循环"""
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.aclose(), self._loop).result(5)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
 
-    def validate_bitcoin_data(self, data: Dict[str, Any]) -> bool:
+    def validate_bitcoin_data(self, data: Dict[str, Any],
+                              required_fields: Optional[list] = None) -> bool:
         """验证比特币数据完整性"""
-        required_fields = ['usd', 'usd_24h_change']
+        if required_fields is None:
+            required_fields = ['usd', 'usd_24h_change']
         for field in required_fields:
             if field not in data:
                 st.error(f"数据验证失败: 缺少必要字段 '{field}'")
                 return False
 
         # 验证价格数据合理性
-        if data['usd'] <= 0:
-            st.error("数据验证失败: 价格数据异常")
-            return False
+        for currency in self.vs_currencies:
+            if currency in data and data[currency] <= 0:
+                st.error("数据验证失败: 价格数据异常")
+                return False
 
         return True
 
-    def fetch_bitcoin_data(self) -> Optional[Dict[str, Any]]:
+    async def _afetch(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        从 CoinGecko API 获取比特币数据
-        返回: dict 包含价格和变化数据，或 None 如果失败
+        从 CoinGecko API 批量获取行情数据（一次请求覆盖所有币种/货币）
+        只做网络与解析，在常驻事件循环线程上执行，不触碰任何 Streamlit API
         """
-        try:
-            response = requests.get(self.api_url, params=self.params, timeout=self.timeout)
-            response.raise_for_status()
+        cache_key = str(sorted(params.items()))
+        headers = {}
+        if cache_key in self._etags:
+            headers['If-None-Match'] = self._etags[cache_key]
+        response = await self.client.get(self.api_url, params=params, headers=headers)
 
-            data = response.json()
-            bitcoin_data = data.get('bitcoin', {})
+        # 304 表示数据未变化，直接复用上次响应，省去响应体传输与解析
+        if response.status_code == 304:
+            return self._last_bodies.get(cache_key)
 
-            if not bitcoin_data:
-                raise ValueError("未找到比特币数据")
+        response.raise_for_status()
 
-            # 数据验证
-            if not self.validate_bitcoin_data(bitcoin_data):
+        # orjson 比标准库解析快数倍；JSONDecodeError 是 ValueError 子类，
+        # 由同步入口的 except ValueError 分支兜住
+        data = orjson.loads(response.content)
+
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etags[cache_key] = etag
+        self._last_bodies[cache_key] = data
+
+        return data
+
+    def _fetch_and_validate(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """在脚本线程上驱动一次获取并验证数据，错误统一映射为页面提示"""
+        try:
+            data = self._run_async(self._afetch(params))
+            if data is None:
                 return None
 
-            return bitcoin_data
+            # 数据验证（只校验本次请求包含的字段，按货币展开）
+            required_fields = list(self.vs_currencies)
+            if params.get('include_24hr_change') == 'true':
+                required_fields += [f'{c}_24h_change' for c in self.vs_currencies]
+            for coin_id in self.coin_ids:
+                coin_data = data.get(coin_id, {})
+                if not coin_data:
+                    raise ValueError(f"未找到 {coin_id} 数据")
+                if not self.validate_bitcoin_data(coin_data, required_fields):
+                    return None
 
-        except requests.exceptions.Timeout:
+            return data
+
+        except httpx.TimeoutException:
             st.error("⏰ 请求超时，请检查网络连接")
             return None
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             st.error("🌐 网络连接错误，请检查网络设置")
             return None
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             st.error(f"🔍 HTTP错误: {e.response.status_code if e.response else '未知'}")
             return None
-        except requests.exceptions.RequestException as e:
+        except httpx.RequestError as e:
             st.error(f"📡 网络请求错误: {str(e)}")
             return None
         except ValueError as e:
@@ -81,25 +282,89 @@ class BitcoinPriceTracker:
             st.error(f"❓ 未知错误: {str(e)}")
             return None
 
-    @st.cache_data(ttl=30)  # 缓存30秒
-    def fetch_bitcoin_data_cached(_self) -> Optional[Dict[str, Any]]:
-        """带缓存的比特币数据获取"""
-        return _self.fetch_bitcoin_data()
+    def fetch_bitcoin_data(self, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """同步入口：在事件循环中驱动异步获取，并按参数做 singleflight 合并"""
+        if params is None:
+            params = self.params
+        key = str(sorted(params.items()))
+
+        with _fetch_lock:
+            flight = _inflight.get(key)
+            if flight is None:
+                flight = _Flight()
+                _inflight[key] = flight
+                is_leader = True
+            else:
+                is_leader = False
+
+        if not is_leader:
+            # 同参数请求已在途：等待其结果，避免多个会话同时打上游
+            if not flight.event.wait(self.timeout + 1):
+                # 等待超时：按失败处理，而不是把旧结果当新鲜数据缓存
+                return None
+            return flight.result
+
+        try:
+            flight.result = self._fetch_and_validate(params)
+            return flight.result
+        finally:
+            with _fetch_lock:
+                _inflight.pop(key, None)
+            flight.event.set()
+
+    @st.cache_data(ttl=60)  # 价格更新频繁，按分钟级缓存
+    def _fetch_price_cached(_self) -> Optional[Dict[str, Any]]:
+        """获取当前价格与更新时间"""
+        return _self.fetch_bitcoin_data({
+            'ids': ','.join(_self.coin_ids),
+            'vs_currencies': ','.join(_self.vs_currencies),
+            'include_last_updated_at': 'true'
+        })
+
+    @st.cache_data(ttl=300)  # 24小时统计变化缓慢，使用更长TTL
+    def _fetch_stats_cached(_self) -> Optional[Dict[str, Any]]:
+        """获取24小时涨跌幅与交易量"""
+        return _self.fetch_bitcoin_data({
+            'ids': ','.join(_self.coin_ids),
+            'vs_currencies': ','.join(_self.vs_currencies),
+            'include_24hr_change': 'true',
+            'include_24hr_vol': 'true'
+        })
+
+    def fetch_bitcoin_data_cached(self) -> Optional[Dict[str, Any]]:
+        """带分级缓存的行情数据获取，上游失败时回退到上次成功数据"""
+        price = self._fetch_price_cached()
+        stats = self._fetch_stats_cached()
+        if price and stats:
+            data = {coin_id: {**stats.get(coin_id, {}), **price.get(coin_id, {})}
+                    for coin_id in self.coin_ids}
+            st.session_state['last_good'] = data
+            return data
+        # API 短暂不可用时继续展示上次成功的数据，而不是错误页
+        return st.session_state.get('last_good')
 
     def fetch_bitcoin_data_with_retry(self, max_retries: int = 3) -> Optional[Dict[str, Any]]:
-        """带重试机制的数据获取"""
+        """带重试机制的数据获取：指数退避加抖动，进度更新单个占位符"""
+        status = st.status("正在获取比特币数据...")
         for attempt in range(max_retries):
-            st.info(f"尝试获取数据 ({attempt + 1}/{max_retries})...")
+            status.update(label=f"尝试获取数据 ({attempt + 1}/{max_retries})...")
             data = self.fetch_bitcoin_data()
             if data:
+                status.update(label="✅ 数据获取成功", state="complete")
                 return data
             if attempt < max_retries - 1:
-                time.sleep(2)  # 等待2秒后重试
+                time.sleep(min(2 ** attempt, 8) + random.random() * 0.25)
+        status.update(label="❌ 数据获取失败", state="error")
         return None
 
     def format_price(self, price: float) -> str:
         """格式化价格显示"""
-        return f"${price:,.2f}"
+        # 价格未变化时直接复用上次的格式化结果
+        if self._last_fmt is not None and self._last_fmt[0] == price:
+            return self._last_fmt[1]
+        formatted = "$" + format(price, ",.2f")
+        self._last_fmt = (price, formatted)
+        return formatted
 
     def format_change(self, change_percent: float, change_amount: float) -> str:
         """格式化变化数据显示"""
@@ -115,83 +380,55 @@ class BitcoinPriceTracker:
 
         return f"{color} {trend} {abs(change_percent):.2f}% (${abs(change_amount):.2f})"
 
-    def calculate_previous_price(self, current_price: float, change_percent: float) -> float:
-        """计算24小时前价格"""
-        change_amount = (current_price * change_percent) / 100
-        return current_price - change_amount
-
-    def display_price_info(self, bitcoin_data: Dict[str, Any]):
-        """显示价格信息"""
-        current_price = bitcoin_data.get('usd', 0)
-        change_percent = bitcoin_data.get('usd_24h_change', 0)
+    @st.cache_data(ttl=60)
+    def _build_view(_self, current_price: float, change_percent: float,
+                    volume: float, last_updated: Optional[int]) -> PriceView:
+        """构建渲染视图：同样的数据在重跑间不会重复计算和格式化"""
         change_amount = (current_price * change_percent) / 100
-        previous_price = self.calculate_previous_price(current_price, change_percent)
-
-        # 主价格显示区域
-        col1, col2 = st.columns([2, 1])
-
-        with col1:
-            # 主价格显示
-            st.markdown(f'<div class="price-display">{self.format_price(current_price)}</div>',
-                        unsafe_allow_html=True)
-
-            # 涨跌幅信息
-            change_display = self.format_change(change_percent, change_amount)
-            if change_percent > 0:
-                st.success(change_display)
-            elif change_percent < 0:
-                st.error(change_display)
-            else:
-                st.info(change_display)
-
-        with col2:
-            # 更新时间
-            last_updated = bitcoin_data.get('last_updated_at')
-            if last_updated:
-                update_time = datetime.fromtimestamp(last_updated)
-                st.caption(f"🕒 {update_time.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # 详细信息卡片
-        st.markdown("---")
+        previous_price = current_price - change_amount
+        return PriceView(
+            current=current_price,
+            prev=previous_price,
+            change_pct=change_percent,
+            change_abs=change_amount,
+            volume=volume,
+            updated_at=last_updated,
+            formatted_current=_self.format_price(current_price),
+            formatted_prev=_self.format_price(previous_price),
+            formatted_change=_self.format_change(change_percent, change_amount)
+        )
+
+    def display_price_info(self, data: Dict[str, Any]):
+        """按币种显示价格信息"""
+        for coin_id in self.coin_ids:
+            coin_data = data.get(coin_id)
+            if coin_data:
+                self._display_coin_info(coin_data)
+
+    def _display_coin_info(self, bitcoin_data: Dict[str, Any]):
+        """显示单个币种的价格信息"""
+        view = self._build_view(
+            bitcoin_data.get('usd', 0),
+            bitcoin_data.get('usd_24h_change', 0),
+            bitcoin_data.get('usd_24h_vol', 0),
+            bitcoin_data.get('last_updated_at')
+        )
+
+        # 主价格区与指标卡合成一个HTML块，一条消息完成渲染
+        st.markdown(render_html(view), unsafe_allow_html=True)
+
+        # 涨跌幅信息（保留原生告警组件以保证可访问性）
+        if view.change_pct > 0:
+            st.success(view.formatted_change)
+        elif view.change_pct < 0:
+            st.error(view.formatted_change)
+        else:
+            st.info(view.formatted_change)
 
-        col3, col4, col5 = st.columns(3)
-
-        with col3:
-            st.metric(
-                label="当前价格",
-                value=self.format_price(current_price),
-                delta=f"{change_percent:.2f}%"
-            )
-
-        with col4:
-            st.metric(
-                label="24小时前价格",
-                value=self.format_price(previous_price)
-            )
-
-        with col5:
-            volume = bitcoin_data.get('usd_24h_vol', 0)
-            st.metric(
-                label="24小时交易量",
-                value=f"${volume:,.0f}"
-            )
-
-        # 趋势分析
+        # 趋势分析（阈值表二分定位，代替逐级比较）
         st.markdown("### 📊 市场趋势分析")
-        if change_percent > 5:
-            st.success(f"🚀 强势上涨: 过去24小时大幅上涨 {change_percent:.2f}%")
-        elif change_percent > 2:
-            st.success(f"📈 稳步上涨: 过去24小时上涨 {change_percent:.2f}%")
-        elif change_percent > 0:
-            st.info(f"↗️ 小幅上涨: 过去24小时微涨 {change_percent:.2f}%")
-        elif change_percent < -5:
-            st.error(f"📉 大幅下跌: 过去24小时大幅下跌 {abs(change_percent):.2f}%")
-        elif change_percent < -2:
-            st.error(f"🔻 明显下跌: 过去24小时下跌 {abs(change_percent):.2f}%")
-        elif change_percent < 0:
-            st.warning(f"↘️ 小幅下跌: 过去24小时微跌 {abs(change_percent):.2f}%")
-        else:
-            st.info("➡️ 价格平稳: 过去24小时价格基本持平")
+        _, display_fn, template = _TREND[bisect.bisect_right(_TREND_THRESHOLDS, view.change_pct)]
+        display_fn(template.format(v=abs(view.change_pct)))
 
     def display_error_state(self):
         """统一的错误状态显示"""
@@ -220,27 +457,44 @@ class BitcoinPriceTracker:
                 st.rerun()
 
 
+@st.cache_resource
+def get_tracker() -> BitcoinPriceTracker:
+    """获取跨重跑复用的追踪器实例（保留连接池）"""
+    return BitcoinPriceTracker()
+
+
 def setup_auto_refresh(refresh_interval: int):
-    """设置自动刷新功能"""
+    """设置自动刷新功能（刷新与倒计时均由浏览器驱动，不占用服务端线程）"""
     if refresh_interval > 0:
-        placeholder = st.empty()
-        for i in range(refresh_interval, 0, -1):
-            with placeholder:
-                st.info(f"⏰ 下次自动刷新: {i}秒")
-            time.sleep(1)
-        placeholder.empty()
-        st.rerun()
+        st_autorefresh(interval=refresh_interval * 1000, key="btc_autorefresh")
+        # 倒计时由 iframe 内的 JS 本地递减，每秒只改浏览器 DOM，不触发服务端重跑
+        components.html(
+            f"""
+            <div style="font-size:0.9rem;color:#808495;font-family:sans-serif;">
+                ⏰ 下次自动刷新: <span id="countdown">{refresh_interval}</span> 秒
+            </div>
+            <script>
+                let n = {refresh_interval};
+                setInterval(() => {{
+                    n -= 1;
+                    if (n >= 0) document.getElementById('countdown').innerText = n;
+                }}, 1000);
+            </script>
+            """,
+            height=30
+        )
 
 
 def main():
     """主应用函数"""
+    _bootstrap()
+
     # 应用标题
-    st.markdown('<div class="main-header">₿ 比特币价格追踪器</div>',
-                unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     st.markdown("实时监控比特币价格走势和市场动态")
 
     # 初始化追踪器
-    tracker = BitcoinPriceTracker()
+    tracker = get_tracker()
 
     # 侧边栏设置
     with st.sidebar:
@@ -290,7 +544,7 @@ def main():
             st.json(bitcoin_data)
 
             # 性能信息
-            st.caption("💡 提示: 数据已缓存30秒以减少API调用")
+            st.caption("💡 提示: 价格缓存60秒、24小时统计缓存300秒以减少API调用")
     else:
         tracker.display_error_state()
 
@@ -299,44 +553,5 @@ def main():
         setup_auto_refresh(refresh_interval)
 
 
-# 自定义CSS样式
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #F7931A;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: bold;
-    }
-    .price-display {
-        font-size: 3.5rem;
-        font-weight: bold;
-        text-align: center;
-        color: #F7931A;
-        margin: 1rem 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-    }
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #F7931A;
-        margin: 0.5rem 0;
-    }
-    .stButton button {
-        border-radius: 8px;
-        font-weight: bold;
-    }
-    .stAlert {
-        border-radius: 10px;
-    }
-</style>
-""", unsafe_allow_html=True)
-
 if __name__ == "__main__":
-    # 初始化session state
-    if 'retry_mode' not in st.session_state:
-        st.session_state.retry_mode = False
-
     main()
\ No newline at end of file